@@ -1,7 +1,13 @@
 from qcodes import load_by_id
-from collections.abc import Sequence
+from qcodes.dataset.data_set import DataSet
+from qcodes.dataset.sqlite.connection import atomic
+from qcodes.dataset.sqlite.database import connect, get_DB_location
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
 from typing import Optional, Any, Union
 
+__all__ = ["annotate_runs", "append_annotation"]
+
 _ANNOTATION_KEY = "post_measurement_annotation"
 _ERROR_KEY = "errors_in_measurement"
 _PLOTTR_KEY = "inspectr_tag"
@@ -11,12 +17,64 @@ _NULL_KEY = ""
 _ADDITIONAL_ANNOTATION_KEY = "\nADDITIONAL ANNOTATION: \n"
 
 
+def _batches(run_ids: Sequence[int], size: int) -> Iterator[Sequence[int]]:
+    """Split run_ids into batches of at most size, or one batch if size <= 0."""
+    if size <= 0:
+        yield run_ids
+        return
+    it = iter(run_ids)
+    while batch := tuple(islice(it, size)):
+        yield batch
+
+
+def _write_runs(
+    run_ids: Sequence[int],
+    commit_every: int,
+    write: Callable[[DataSet], None],
+) -> None:
+    """Call write on the dataset of each run, committing in batches.
+
+    All runs are loaded before anything is written, so an invalid run_id fails
+    before any transaction is opened. The datasets share one connection, which
+    is closed again afterwards, so each batch is committed at once.
+    """
+    conn = connect(get_DB_location())
+    try:
+        # Each distinct run is loaded once, even if run_ids has duplicates
+        datasets = {
+            run_id: load_by_id(run_id, conn=conn) for run_id in dict.fromkeys(run_ids)
+        }
+        for batch in _batches(run_ids, commit_every):
+            with atomic(conn):
+                for run_id in batch:
+                    write(datasets[run_id])
+    finally:
+        conn.close()
+
+
+def _metadata_writes(
+    error_state: Optional[bool],
+    other_metadata: Optional[dict[str, Any]],
+    flag_in_plottr: Optional[bool],
+) -> list[tuple[str, Any]]:
+    """Metadata (key, value) pairs which are identical for every run."""
+    writes = []
+    if error_state is not None:
+        writes.append((_ERROR_KEY, error_state))
+        if flag_in_plottr and error_state is True:
+            writes.append((_PLOTTR_KEY, _CROSS_KEY))
+    if other_metadata:
+        writes.extend(other_metadata.items())
+    return writes
+
+
 def annotate_runs(
     run_ids: Union[int, Sequence[int]],
     annotation: Optional[str] = None,
     error_state: Optional[bool] = None,
     other_metadata: Optional[dict[str, Any]] = None,
     flag_in_plottr: Optional[bool] = True,
+    commit_every: int = 0,
 ) -> None:
     """Add annotation as metadata to a QCoDes measurement.
 
@@ -37,23 +95,35 @@ def annotate_runs(
         or update in the dataset.
     flag_in_plottr (bool), default = True: Whether or not to flag measurements
         with a 'cross' in plottr-inspectr if they have error_state = True.
+    commit_every (int), default = 0: Number of runs to write per database
+        transaction. If 0, all runs are committed in a single transaction.
+
+    Raises:
+    -------
+    ValueError: If any of the run_ids does not exist. Nothing is written.
+    RuntimeError: If writing the metadata fails. The transaction of the current
+        batch is rolled back and qcodes re-raises the error as a RuntimeError,
+        with the original exception as its cause. Batches committed earlier
+        are kept.
     """
+    if annotation is None and error_state is None and not other_metadata:
+        return
     if isinstance(run_ids, int):
         run_ids = (run_ids,)
-    for run_id in run_ids:
-        data = load_by_id(run_id)
-        if annotation is not None:
-            data.add_metadata(_ANNOTATION_KEY, annotation)
-        if error_state is not None:
-            data.add_metadata("errors_in_measurement", error_state)
-            if flag_in_plottr:
-                if error_state is True:
-                    data.add_metadata(_PLOTTR_KEY, _CROSS_KEY)
-                elif error_state is False and data.metadata[_PLOTTR_KEY] != _STAR_KEY:
-                    data.add_metadata(_PLOTTR_KEY, _NULL_KEY)
-        if other_metadata is not None:
-            for k, v in other_metadata.items():
-                data.add_metadata(k, v)
+    writes = _metadata_writes(error_state, other_metadata, flag_in_plottr)
+    if annotation is not None:
+        writes.insert(0, (_ANNOTATION_KEY, annotation))
+    clear_cross = flag_in_plottr and error_state is False
+
+    def write(data: DataSet) -> None:
+        add = data.add_metadata
+        # Written first so that other_metadata can still override it
+        if clear_cross and data.metadata.get(_PLOTTR_KEY) != _STAR_KEY:
+            add(_PLOTTR_KEY, _NULL_KEY)
+        for k, v in writes:
+            add(k, v)
+
+    _write_runs(run_ids, commit_every, write)
 
 
 def append_annotation(
@@ -62,6 +132,7 @@ def append_annotation(
     error_state: Optional[bool] = None,
     other_metadata: Optional[dict[str, Any]] = None,
     flag_in_plottr: Optional[bool] = True,
+    commit_every: int = 0,
 ) -> None:
     """Append annotations to QCoDes measurements without overwriting.
 
@@ -83,24 +154,33 @@ def append_annotation(
         or update in the dataset.
     flag_in_plottr (bool), default = True: Whether or not to flag measurements
         with a 'cross' in plottr-inspectr if they have error_state = True.
+    commit_every (int), default = 0: Number of runs to write per database
+        transaction. If 0, all runs are committed in a single transaction.
+
+    Raises:
+    -------
+    ValueError: If any of the run_ids does not exist. Nothing is written.
+    RuntimeError: If writing the metadata fails. The transaction of the current
+        batch is rolled back and qcodes re-raises the error as a RuntimeError,
+        with the original exception as its cause. Batches committed earlier
+        are kept.
     """
+    if annotation is None and error_state is None and not other_metadata:
+        return
     if isinstance(run_ids, int):
         run_ids = (run_ids,)
-    for run_id in run_ids:
-        dataset = load_by_id(run_id)
-        metadata = dataset.metadata
-        full_annotation = ""
-        if _ANNOTATION_KEY in metadata:
-            full_annotation += metadata[_ANNOTATION_KEY]
-            if annotation is not None:
-                full_annotation += _ADDITIONAL_ANNOTATION_KEY
+    writes = _metadata_writes(error_state, other_metadata, flag_in_plottr)
+
+    def write(dataset: DataSet) -> None:
+        add = dataset.add_metadata
         if annotation is not None:
-            full_annotation += annotation
-        dataset.add_metadata(_ANNOTATION_KEY, annotation)
-        if error_state is not None:
-            dataset.add_metadata(_ERROR_KEY, error_state)
-            if flag_in_plottr and error_state is True:
-                dataset.add_metadata(_PLOTTR_KEY, _CROSS_KEY)
-        if other_metadata is not None:
-            for k, v in other_metadata.items():
-                dataset.add_metadata(k, v)
+            metadata = dataset.metadata
+            parts = []
+            if _ANNOTATION_KEY in metadata:
+                parts += [metadata[_ANNOTATION_KEY], _ADDITIONAL_ANNOTATION_KEY]
+            parts.append(annotation)
+            add(_ANNOTATION_KEY, "".join(parts))
+        for k, v in writes:
+            add(k, v)
+
+    _write_runs(run_ids, commit_every, write)
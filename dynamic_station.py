@@ -1,8 +1,16 @@
 from qcodes import Station, Parameter, Instrument
 from qcodes.utils.metadata import Metadatable
 from collections.abc import Sequence
-from typing import Any, Union
+from functools import cached_property
+from itertools import chain
+import logging
+from typing import Any, Optional, Union
 from warnings import warn
+from .must_update_parameter import MustUpdateParameter, _warn_verbose_deprecated
+
+__all__ = ["DynamicStation"]
+
+log = logging.getLogger(__name__)
 
 
 class DynamicStation(Station):
@@ -18,48 +26,118 @@ class DynamicStation(Station):
     ----------
     component_configurations (dict): Dictionary of possible, not mutually
         exclusive, sets of components and parameters to include in the station.
+        The configurations are copied when set, so later changes to the
+        dictionary or its lists have no effect until they are passed to
+        set_component_configurations again.
     """
 
     def __init__(
         self,
         *components: Metadatable,
-        component_configurations: dict[str, Union[Parameter, Instrument]] = None,
+        component_configurations: Optional[
+            dict[str, Sequence[Union[Parameter, Instrument]]]
+        ] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*components, **kwargs)
-        self._component_configurations = dict()
+        # Configuration keys and station component names after the last
+        # adjust_station_to_meas_setup call
+        self._last_applied: Optional[tuple[frozenset[str], frozenset[str]]] = None
+        self._ensure_cache: dict[tuple[str, ...], tuple[Metadatable, ...]] = dict()
         self.set_component_configurations(component_configurations)
 
+    def add_component(
+        self,
+        component: Metadatable,
+        name: Optional[str] = None,
+        update_snapshot: bool = True,
+    ) -> str:
+        name = super().add_component(
+            component, name=name, update_snapshot=update_snapshot
+        )
+        self.__dict__.pop("_must_update_params", None)
+        return name
+
+    def remove_component(self, name: str) -> Optional[Metadatable]:
+        component = super().remove_component(name)
+        self.__dict__.pop("_must_update_params", None)
+        return component
+
+    @cached_property
+    def _must_update_params(self) -> list[MustUpdateParameter]:
+        """All MustUpdateParameters in the station, reset on add/remove."""
+        return [
+            c for c in self.components.values() if isinstance(c, MustUpdateParameter)
+        ]
+
     def set_component_configurations(
-        self, component_configurations: dict[str, Union[Parameter, Instrument]]
+        self,
+        component_configurations: dict[str, Sequence[Union[Parameter, Instrument]]],
     ) -> None:
         # TODO: Implement a validator of some sort for this function
-        self._component_configurations = component_configurations
+        component_configurations = component_configurations or dict()
+        # Only immutable snapshots are kept, see the class docstring
+        self._config_components = {
+            k: tuple(v) for k, v in component_configurations.items()
+        }
+        self._config_name_sets = {
+            k: frozenset(c.name for c in v) for k, v in component_configurations.items()
+        }
+        self._ensure_cache.clear()
+        self._last_applied = None
+
+    def _components_to_ensure(self, config: Sequence[str]) -> tuple[Metadatable, ...]:
+        """Deduplicated components of the given configuration keys, in order."""
+        key = tuple(dict.fromkeys(config))
+        if key not in self._ensure_cache:
+            configs = self._config_components
+            self._ensure_cache[key] = tuple(
+                dict.fromkeys(chain.from_iterable(configs[k] for k in key))
+            )
+        return self._ensure_cache[key]
 
     def adjust_station_to_meas_setup(
-        self, config: Sequence[str], verbose: bool = True
+        self, config: Sequence[str], verbose: Optional[bool] = None
     ) -> None:
-        configs = self._component_configurations
-        components_to_ensure = sum([configs[k] for k in config], [])
-        components_to_remove = set(
-            sum([configs[k] for k in configs.keys() if k not in config], [])
+        if verbose is not None:
+            _warn_verbose_deprecated(__name__)
+        config_key = frozenset(config)
+        last_applied = self._last_applied
+        if (
+            last_applied is not None
+            and config_key == last_applied[0]
+            and self.components.keys() == last_applied[1]
+        ):
+            # Same configuration, and the station's components are unchanged
+            # since it was applied (and warned about), so there is nothing to do
+            return
+        name_sets = self._config_name_sets
+        components_to_ensure = self._components_to_ensure(config)
+        ensure_names = frozenset().union(*(name_sets[k] for k in config))
+        remove_names = (
+            frozenset().union(*(v for k, v in name_sets.items() if k not in config))
+            - ensure_names
+        )
+        log.debug(
+            "Ensuring components: %s Removing components: %s",
+            components_to_ensure,
+            remove_names,
         )
-        components_to_remove.difference_update(components_to_ensure)
         if verbose:
             print(
                 "Ensuring components:",
                 components_to_ensure,
                 "Removing components:",
-                components_to_remove,
+                remove_names,
             )
         # REMOVE UNUSED COMPONENTS
         must_remove_components = []
         for component in self.components:
-            if component in [
-                c.name for c in components_to_remove
-            ] and component not in [c.name for c in components_to_ensure]:
+            if component in ensure_names:
+                continue
+            if component in remove_names:
                 must_remove_components.append(component)
-            elif component not in [c.name for c in components_to_ensure]:
+            else:
                 warn(
                     f"A component, {component}, exists in the qcodes.Station "
                     "which is not in the list of components used for "
@@ -70,8 +148,10 @@ class DynamicStation(Station):
         for component in must_remove_components:
             self.remove_component(component)
         # ADD USED COMPONENTS
-        for component in list(set(components_to_ensure)):
+        for component in components_to_ensure:
             if component.name not in self.components:
                 self.add_component(component)
+        self._last_applied = (config_key, frozenset(self.components))
+        log.debug("Station components: %s", self.components)
         if verbose:
             print(self.components)
@@ -2,6 +2,44 @@ from qcodes import Parameter, Station
 from qcodes.utils.validators import Strings
 from collections.abc import Sequence
 from typing import Optional, Any
+from warnings import warn
+import logging
+import numpy as np
+
+__all__ = [
+    "MustUpdateParameter",
+    "MeasurementDescription",
+    "check_parameters_updated",
+    "ParameterNotUpdatedError",
+    "ValueUnchangedError",
+]
+
+log = logging.getLogger(__name__)
+
+
+class ParameterNotUpdatedError(RuntimeError):
+    """Raised when the value of a MustUpdateParameter was already used."""
+
+
+class ValueUnchangedError(ValueError):
+    """Raised when a MustUpdateParameter is set to its current value."""
+
+
+def _warn_verbose_deprecated(logger_name: str) -> None:
+    """Warn the caller of a function that its verbose argument is deprecated."""
+    warn(
+        "The verbose argument is deprecated, enable DEBUG logging for "
+        f"the {logger_name} logger instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    """Compare two parameter values, elementwise for numpy arrays."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
 
 
 class MustUpdateParameter(Parameter):
@@ -53,7 +91,7 @@ class MustUpdateParameter(Parameter):
     # you must provide a get method, a set method, or both.
     def get_raw(self):
         if self._latest_value_read and self.strict:
-            raise Exception(
+            raise ParameterNotUpdatedError(
                 f"Current value of {self.name} has already been read, "
                 f"update to a new value or set {self.name}.strict = False "
                 "to disable this behavior."
@@ -62,8 +100,10 @@ class MustUpdateParameter(Parameter):
         return self._value
 
     def set_raw(self, val):
-        if self._value == val and self._new_value_must_differ:
-            raise Exception(
+        new_value_must_differ = self._new_value_must_differ
+        value = self._value
+        if new_value_must_differ and (val is value or _values_equal(val, value)):
+            raise ValueUnchangedError(
                 "New measurement description must differ from the previous one!"
             )
         self._latest_value_in_measurement = (
@@ -71,12 +111,20 @@ class MustUpdateParameter(Parameter):
         )
         self._latest_value_read = False
         self._value = val
-        return self._value
+        return val
 
 
 class MeasurementDescription(MustUpdateParameter):
+    # Validators hold no per-parameter state, so all instances share one
+    _description_validator = Strings()
+
     def __init__(self, name: str, **kwargs: Any) -> None:
-        super().__init__(name, vals=Strings(), new_value_must_differ=True, **kwargs)
+        super().__init__(
+            name,
+            vals=self._description_validator,
+            new_value_must_differ=True,
+            **kwargs,
+        )
         self.__doc__ = (
             "A string description of the current measurement. "
             "Contains a checker which asserts that this parameter "
@@ -86,21 +134,28 @@ class MeasurementDescription(MustUpdateParameter):
 
 def check_parameters_updated(
     params: Optional[Sequence[MustUpdateParameter]] = None,
-    verbose: Optional[bool] = True,
+    verbose: Optional[bool] = None,
 ) -> None:
+    if verbose is not None:
+        _warn_verbose_deprecated(__name__)
     if params is None:
         station = Station.default
-        params = [
-            station[c]
-            for c in station.components
-            if isinstance(station[c], MustUpdateParameter)
-        ]
+        # DynamicStation caches this list between measurements
+        params = getattr(station, "_must_update_params", None)
+        if params is None:
+            params = [
+                c
+                for c in station.components.values()
+                if isinstance(c, MustUpdateParameter)
+            ]
+    log.debug("Checking parameters: %s", params)
     if verbose:
         print(params)
     for param in params:
         if param._latest_value_in_measurement:
-            raise Exception(
-                f"The latest value of {param.label}: {param()}{param.unit} "
+            raise ParameterNotUpdatedError(
+                f"The latest value of {param.label}: "
+                f"{param.cache.get(get_if_invalid=False)}{param.unit} "
                 "has already been recorded in a previous measurement. Update "
                 "the value of this parameter and try again."
             )